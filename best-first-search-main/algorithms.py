@@ -1,4 +1,5 @@
 import heapq
+from algorithms_numba import NUMBA_AVAILABLE, search_njit
 
 class BestFirstSearch:
     """
@@ -21,21 +22,30 @@ class BestFirstSearch:
         self.expanded_nodes = []  # Liste des nœuds dans l'ordre où ils ont été explorés
         self.open_set = []  # File de priorité (heap) pour les nœuds à explorer
     
-    def search(self):
+    def search(self, record_steps=True):
         """
         Exécute l'algorithme Best-First Search sur le graphe.
         
+        Args:
+            record_steps: Si False, les étapes ne sont pas enregistrées et, si
+                numba est installé, la recherche utilise la version compilée
+                (voir algorithms_numba.search_njit)
+        
         Returns:
             tuple: (chemin, nœuds_explorés, steps) où:
                 - chemin est la liste des nœuds formant le chemin de la solution
                 - nœuds_explorés est la liste des nœuds visités dans l'ordre
                 - steps est une liste d'états pour visualiser l'exécution étape par étape
+            Les nœuds sont désignés par leurs indices internes (voir Graph.id_of).
         """
         if not self.graph.start_node or not self.graph.goal_node:
             raise ValueError("Les nœuds de départ et d'arrivée doivent être définis")
         
-        start = self.graph.start_node
-        goal = self.graph.goal_node
+        start = self.graph.iloc_of(self.graph.start_node)
+        goal = self.graph.iloc_of(self.graph.goal_node)
+        
+        if not record_steps and NUMBA_AVAILABLE:
+            return self._search_compiled(start, goal)
         
         # Réinitialiser les structures de données
         self.visited = set()
@@ -47,12 +57,16 @@ class BestFirstSearch:
         steps = []
         
         # Ajouter le nœud de départ à la file de priorité
-        # Format (heuristic, node_id, parent)
-        heapq.heappush(self.open_set, (self.graph.get_heuristic(start), start, None))
+        # Format (heuristic, rang_node, rang_parent) : les nœuds sont désignés
+        # par leur rang dans l'ordre des identifiants (voir Graph.id_ranks), qui
+        # départage les heuristiques égales ; -1 : pas de parent
+        ranks, order = self.graph.id_ranks()
+        heapq.heappush(self.open_set, (self.graph.get_heuristic(start), int(ranks[start]), -1))
         
         while self.open_set:
             # Prendre le nœud avec la plus petite valeur heuristique
-            _, current, parent = heapq.heappop(self.open_set)
+            _, current_rank, parent_rank = heapq.heappop(self.open_set)
+            current = order[current_rank]
             
             # Si le nœud a déjà été visité, passer au suivant
             if current in self.visited:
@@ -63,16 +77,17 @@ class BestFirstSearch:
             self.expanded_nodes.append(current)
             
             # Enregistrer le parent pour reconstruire le chemin
-            if parent:
-                self.path[current] = parent
+            if parent_rank != -1:
+                self.path[current] = order[parent_rank]
             
             # Enregistrer l'état actuel pour la visualisation
-            steps.append({
-                'current': current,
-                'open_set': list(self.open_set),
-                'visited': list(self.visited),
-                'path_so_far': self._reconstruct_path(current)
-            })
+            if record_steps:
+                steps.append({
+                    'current': current,
+                    'open_set': list(self.open_set),
+                    'visited': list(self.visited),
+                    'path_so_far': self._reconstruct_path(current)
+                })
             
             # Si nous avons atteint l'objectif, terminer la recherche
             if current == goal:
@@ -80,18 +95,35 @@ class BestFirstSearch:
                 path = self._reconstruct_path(current)
                 return path, self.expanded_nodes, steps
             
-            # Explorer les voisins non visités
-            for neighbor in self.graph.get_neighbors(current):
+            # Explorer les voisins non visités ; leurs heuristiques sont lues
+            # en une seule fois sur le tableau des voisins
+            neighbors = self.graph.get_neighbors(current)
+            heuristics = self.graph.get_heuristic(neighbors)
+            for neighbor, heuristic, rank in zip(neighbors.tolist(), heuristics.tolist(), ranks[neighbors].tolist()):
                 if neighbor not in self.visited:
                     # Ajouter le voisin à la file de priorité avec sa valeur heuristique
-                    heapq.heappush(
-                        self.open_set, 
-                        (self.graph.get_heuristic(neighbor), neighbor, current)
-                    )
+                    heapq.heappush(self.open_set, (heuristic, rank, current_rank))
         
         # Si aucun chemin n'est trouvé
         return None, self.expanded_nodes, steps
     
+    def _search_compiled(self, start, goal):
+        """
+        Exécute la recherche avec search_njit et remplit les mêmes attributs
+        que la version Python (sans enregistrer d'étapes).
+        """
+        indptr, indices, _, heur = self.graph.csr_arrays()
+        path, expanded, parents = search_njit(indptr, indices, heur, self.graph.id_ranks()[0], start, goal)
+        
+        self.expanded_nodes = expanded.tolist()
+        self.visited = set(self.expanded_nodes)
+        self.path = {node: parent for node, parent in zip(self.expanded_nodes, parents[expanded].tolist()) if parent != -1}
+        self.open_set = []
+        
+        if len(path) == 0:
+            return None, self.expanded_nodes, []
+        return path.tolist(), self.expanded_nodes, []
+    
     def _reconstruct_path(self, node):
         """
         Reconstruit le chemin du nœud de départ jusqu'au nœud actuel.
@@ -0,0 +1,135 @@
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # numba est optionnel : BestFirstSearch garde sa version Python
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+
+def _njit(func):
+    """Compile la fonction avec numba.njit si numba est disponible."""
+    if numba is None:
+        return func
+    return numba.njit(cache=True)(func)
+
+
+@_njit
+def _heap_less(keys, nodes, parents, ranks, a, b):
+    """
+    Compare deux entrées du tas comme les tuples (heuristique, rang du nœud,
+    rang du parent) de la version Python ; le départ n'a pas de parent (-1).
+    """
+    if keys[a] != keys[b]:
+        return keys[a] < keys[b]
+    if nodes[a] != nodes[b]:
+        return ranks[nodes[a]] < ranks[nodes[b]]
+    if parents[a] == parents[b]:
+        return False
+    if parents[a] == -1 or parents[b] == -1:
+        return parents[a] == -1
+    return ranks[parents[a]] < ranks[parents[b]]
+
+
+@_njit
+def _heap_swap(keys, nodes, parents, a, b):
+    keys[a], keys[b] = keys[b], keys[a]
+    nodes[a], nodes[b] = nodes[b], nodes[a]
+    parents[a], parents[b] = parents[b], parents[a]
+
+
+@_njit
+def _heap_push(keys, nodes, parents, ranks, size, key, node, parent):
+    """Ajoute une entrée au tas binaire et renvoie sa nouvelle taille."""
+    keys[size] = key
+    nodes[size] = node
+    parents[size] = parent
+    i = size
+    while i > 0:
+        up = (i - 1) // 2
+        if not _heap_less(keys, nodes, parents, ranks, i, up):
+            break
+        _heap_swap(keys, nodes, parents, i, up)
+        i = up
+    return size + 1
+
+
+@_njit
+def _heap_pop(keys, nodes, parents, ranks, size):
+    """Retire la plus petite entrée du tas ; renvoie (nœud, parent, nouvelle taille)."""
+    node = nodes[0]
+    parent = parents[0]
+    size -= 1
+    _heap_swap(keys, nodes, parents, 0, size)
+    i = 0
+    while True:
+        smallest = i
+        left = 2 * i + 1
+        right = left + 1
+        if left < size and _heap_less(keys, nodes, parents, ranks, left, smallest):
+            smallest = left
+        if right < size and _heap_less(keys, nodes, parents, ranks, right, smallest):
+            smallest = right
+        if smallest == i:
+            break
+        _heap_swap(keys, nodes, parents, i, smallest)
+        i = smallest
+    return node, parent, size
+
+
+@_njit
+def search_njit(indptr, indices, heur, ranks, start, goal):
+    """
+    Best-First Search sur les tableaux CSR d'un Graph (voir Graph.csr_arrays).
+
+    Le tas est un tas binaire sur des tableaux préalloués (une entrée au plus
+    par arête, plus le nœud de départ), ordonné comme la version Python : les
+    égalités d'heuristique sont départagées par ranks (voir Graph.id_ranks).
+
+    Returns:
+        tuple: (chemin, nœuds_explorés, parents) sous forme de tableaux d'indices
+        internes ; chemin est vide si le but n'est pas atteignable, parents vaut
+        -1 pour les nœuds sans parent.
+    """
+    n = len(heur)
+    capacity = len(indices) + 1
+    keys = np.empty(capacity, dtype=np.float32)
+    nodes = np.empty(capacity, dtype=np.int32)
+    parents = np.empty(capacity, dtype=np.int32)
+
+    visited = np.zeros(n, dtype=np.bool_)
+    parent_of = np.full(n, -1, dtype=np.int32)
+    expanded = np.empty(n, dtype=np.int32)
+    n_expanded = 0
+
+    size = _heap_push(keys, nodes, parents, ranks, 0, heur[start], start, -1)
+    while size > 0:
+        current, parent, size = _heap_pop(keys, nodes, parents, ranks, size)
+        if visited[current]:
+            continue
+
+        visited[current] = True
+        parent_of[current] = parent
+        expanded[n_expanded] = current
+        n_expanded += 1
+
+        if current == goal:
+            length = 1
+            node = current
+            while parent_of[node] != -1:
+                node = parent_of[node]
+                length += 1
+            path = np.empty(length, dtype=np.int32)
+            node = current
+            for k in range(length - 1, -1, -1):
+                path[k] = node
+                node = parent_of[node]
+            return path, expanded[:n_expanded], parent_of
+
+        for k in range(indptr[current], indptr[current + 1]):
+            neighbor = indices[k]
+            if not visited[neighbor]:
+                size = _heap_push(keys, nodes, parents, ranks, size, heur[neighbor], neighbor, current)
+
+    return np.empty(0, dtype=np.int32), expanded[:n_expanded], parent_of
@@ -1,15 +1,58 @@
+from array import array
 import json
+
 import networkx as nx
+import numpy as np
+import orjson
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+# Types des tableaux internes : indices sur 32 bits, valeurs en float32
+INDEX_DTYPE = np.int32
+VALUE_DTYPE = np.float32
 
 class Graph:
     """
     Classe représentant un graphe pour l'algorithme Best-First Search.
+
+    Le graphe est stocké au format CSR (Compressed Sparse Row) : les voisins du
+    nœud d'indice interne i sont indices[indptr[i]:indptr[i+1]], avec les poids
+    correspondants dans weights au même emplacement.
     """
     def __init__(self):
-        self.graph = nx.DiGraph()
         self.start_node = None
         self.goal_node = None
         
+        # Correspondance identifiant <-> indice interne (iloc). Au chargement,
+        # les indices internes suivent l'ordre Reverse Cuthill-McKee (voir
+        # _reorder_nodes) ; _rank donne pour chaque iloc son rang d'ajout d'origine.
+        self._id2i = {}
+        self._ids = []
+        self._rank = np.empty(0, dtype=INDEX_DTYPE)
+        
+        # Tableaux CSR
+        self._indptr = np.zeros(1, dtype=INDEX_DTYPE)
+        self._indices = np.empty(0, dtype=INDEX_DTYPE)
+        self._weights = np.empty(0, dtype=VALUE_DTYPE)
+        self._heur = np.empty(0, dtype=VALUE_DTYPE)
+        
+        # Éléments ajoutés depuis la dernière finalisation, dans des tampons
+        # typés (4 octets par valeur) plutôt que des listes d'objets Python
+        self._pending_heur = array('f')
+        self._pending_src = array('i')
+        self._pending_dst = array('i')
+        self._pending_weights = array('f')
+        self._dirty = False
+        
+        # Incrémenté à chaque modification (invalide les caches des visualiseurs)
+        self._version = 0
+        
+        # Vue networkx, construite à la demande pour la visualisation
+        self._nx = None
+        
+        # Rangs des nœuds dans l'ordre trié des identifiants et ordre inverse (voir id_ranks)
+        self._id_rank = None
+        
     def add_node(self, node_id, heuristic=0):
         """
         Ajoute un nœud au graphe avec sa valeur heuristique.
@@ -18,7 +61,19 @@ class Graph:
             node_id: Identifiant unique du nœud
             heuristic: Valeur heuristique du nœud (estimation du coût pour atteindre le but)
         """
-        self.graph.add_node(node_id, heuristic=heuristic)
+        # Convertir avant toute modification : une valeur invalide laisse le graphe intact
+        heuristic = float(heuristic)
+        i = self._id2i.get(node_id)
+        if i is None:
+            self._id2i[node_id] = len(self._ids)
+            self._ids.append(node_id)
+            self._pending_heur.append(heuristic)
+        elif i < len(self._heur):
+            self._heur[i] = heuristic
+        else:
+            self._pending_heur[i - len(self._heur)] = heuristic
+        self._dirty = True
+        self._version += 1
     
     def add_edge(self, from_node, to_node, weight=1):
         """
@@ -29,87 +84,347 @@ class Graph:
             to_node: Nœud d'arrivée
             weight: Poids/coût de l'arête
         """
-        self.graph.add_edge(from_node, to_node, weight=weight)
+        # Convertir avant toute modification : une valeur invalide laisse le graphe intact
+        weight = float(weight)
+        
+        # Comme networkx, créer les extrémités inconnues
+        for node_id in (from_node, to_node):
+            if node_id not in self._id2i:
+                self.add_node(node_id)
+        
+        self._pending_src.append(self._id2i[from_node])
+        self._pending_dst.append(self._id2i[to_node])
+        self._pending_weights.append(weight)
+        self._dirty = True
+        self._version += 1
+    
+    def finalize(self):
+        """
+        Construit les tableaux CSR à partir des nœuds et arêtes ajoutés.
+        
+        Appelée à la fin de load_from_file, et automatiquement avant toute
+        requête si le graphe a été modifié depuis.
+        """
+        if not self._dirty:
+            return
+        
+        n = len(self._ids)
+        old_n = len(self._heur)
+        
+        heur = np.empty(n, dtype=VALUE_DTYPE)
+        heur[:old_n] = self._heur
+        heur[old_n:] = self._pending_heur
+        
+        # Arêtes déjà en place (remises sous forme de liste) suivies des nouvelles
+        old_src = np.repeat(np.arange(old_n, dtype=INDEX_DTYPE), np.diff(self._indptr))
+        src = np.concatenate([old_src, np.asarray(self._pending_src, dtype=INDEX_DTYPE)])
+        dst = np.concatenate([self._indices, np.asarray(self._pending_dst, dtype=INDEX_DTYPE)])
+        weights = np.concatenate([self._weights, np.asarray(self._pending_weights, dtype=VALUE_DTYPE)])
+        
+        self._heur = heur
+        self._rank = np.concatenate([self._rank, np.arange(old_n, n, dtype=INDEX_DTYPE)])
+        self._indptr, self._indices, self._weights = self._build_csr(n, src, dst, weights)
+        self._sort_neighbors()
+        
+        self._pending_heur = array('f')
+        self._pending_src = array('i')
+        self._pending_dst = array('i')
+        self._pending_weights = array('f')
+        self._dirty = False
+        self._nx = None
+        self._id_rank = None
+    
+    @staticmethod
+    def _build_csr(n, src, dst, weights):
+        """
+        Construit (indptr, indices, weights) à partir d'une liste d'arêtes.
+        
+        Les arêtes sont triées par nœud source ; en cas de doublon, la dernière
+        arête ajoutée l'emporte (même comportement que networkx).
+        """
+        order = np.lexsort((dst, src))
+        src, dst, weights = src[order], dst[order], weights[order]
+        
+        if len(src):
+            keep = np.ones(len(src), dtype=bool)
+            keep[:-1] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+            src, dst, weights = src[keep], dst[keep], weights[keep]
+        
+        indptr = np.empty(n + 1, dtype=INDEX_DTYPE)
+        indptr[0] = 0
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        return indptr, dst.astype(INDEX_DTYPE, copy=False), weights.astype(VALUE_DTYPE, copy=False)
+    
+    def _reorder_nodes(self):
+        """
+        Renumérote les nœuds selon l'ordre Reverse Cuthill-McKee.
+        
+        Cet ordre réduit la largeur de bande de la matrice d'adjacence : les
+        voisins d'un nœud ont des indices proches du sien, et les accès à
+        heur[voisins] pendant la recherche restent dans les mêmes lignes de
+        cache. Appelée uniquement par load_from_file, avant que des indices
+        internes n'aient été communiqués : les nœuds ajoutés ensuite gardent
+        leurs indices.
+        """
+        n = len(self._ids)
+        if n == 0:
+            return
+        matrix = csr_matrix((self._weights, self._indices, self._indptr), shape=(n, n))
+        perm = reverse_cuthill_mckee(matrix, symmetric_mode=False).astype(INDEX_DTYPE)
+        inv_perm = np.empty(n, dtype=INDEX_DTYPE)
+        inv_perm[perm] = np.arange(n, dtype=INDEX_DTYPE)
+        
+        src = inv_perm[np.repeat(np.arange(n), np.diff(self._indptr))]
+        dst = inv_perm[self._indices]
+        
+        self._ids = [self._ids[i] for i in perm.tolist()]
+        self._id2i = {node_id: i for i, node_id in enumerate(self._ids)}
+        self._heur = self._heur[perm]
+        self._rank = self._rank[perm]
+        self._indptr, self._indices, self._weights = self._build_csr(n, src, dst, self._weights)
+        self._id_rank = None
+    
+    def _sort_neighbors(self):
+        """
+        Trie la liste de voisins de chaque nœud par heuristique croissante.
+        
+        Le voisin le plus prometteur est ainsi lu en premier et les
+        heuristiques consultées lors d'une expansion sont dans l'ordre de la
+        file de priorité. Un seul tri (source, heuristique) sur toutes les
+        arêtes remplace un tri par nœud ; à heuristique égale, l'ordre des
+        destinations est conservé.
+        """
+        rows = np.repeat(np.arange(len(self._ids), dtype=INDEX_DTYPE), np.diff(self._indptr))
+        order = np.lexsort((self._heur[self._indices], rows))
+        self._indices = self._indices[order]
+        self._weights = self._weights[order]
+    
+    @property
+    def graph(self):
+        """
+        Vue networkx du graphe, utilisée uniquement par GraphVisualizer.
+        
+        Construite au premier accès à partir des tableaux CSR : une recherche
+        sans visualisation n'alloue jamais de DiGraph.
+        """
+        self.finalize()
+        if self._nx is None:
+            self._nx = self._build_nx_graph()
+        return self._nx
+    
+    def _build_nx_graph(self):
+        """
+        Construit la vue networkx du graphe à partir des tableaux CSR.
+        
+        Les nœuds de la vue sont les indices internes ; l'identifiant d'origine
+        est conservé dans l'attribut 'label'. Ils sont insérés dans leur ordre
+        d'ajout d'origine, pour que la disposition (spring_layout) ne dépende
+        pas de la renumérotation interne.
+        """
+        graph = nx.DiGraph()
+        original_order = np.argsort(self._rank).tolist()
+        for i in original_order:
+            graph.add_node(i, label=self._ids[i], heuristic=float(self._heur[i]))
+        
+        for i in original_order:
+            start, end = self._indptr[i], self._indptr[i + 1]
+            for j, weight in zip(self._indices[start:end].tolist(), self._weights[start:end].tolist()):
+                graph.add_edge(i, j, weight=weight)
+        return graph
+    
+    def id_ranks(self):
+        """
+        Renvoie les rangs des nœuds dans l'ordre trié des identifiants.
+        
+        La recherche départage les nœuds de même heuristique avec ce rang, ce
+        qui reproduit la comparaison des identifiants d'origine quel que soit
+        l'ordre des indices internes. Si les identifiants ne sont pas tous
+        comparables entre eux (par exemple des entiers et des chaînes), ils
+        sont d'abord regroupés par nom de type.
+        
+        Returns:
+            tuple: (ranks, order) où ranks[iloc] est le rang du nœud et
+            order[rang] son indice interne (liste Python, pour la file de
+            priorité de BestFirstSearch.search)
+        """
+        self.finalize()
+        if self._id_rank is None:
+            try:
+                order = sorted(range(len(self._ids)), key=self._ids.__getitem__)
+            except TypeError:
+                order = sorted(range(len(self._ids)), key=lambda i: (type(self._ids[i]).__name__, self._ids[i]))
+            ranks = np.empty(len(order), dtype=INDEX_DTYPE)
+            ranks[order] = np.arange(len(order), dtype=INDEX_DTYPE)
+            self._id_rank = (ranks, order)
+        return self._id_rank
+    
+    def csr_arrays(self):
+        """
+        Renvoie les tableaux internes (indptr, indices, weights, heuristic).
+        
+        Utilisé par les implémentations compilées de la recherche ; les tableaux
+        ne doivent pas être modifiés.
+        """
+        self.finalize()
+        return self._indptr, self._indices, self._weights, self._heur
+    
+    def iloc_of(self, node_id):
+        """Renvoie l'indice interne (iloc) d'un nœud à partir de son identifiant."""
+        return self._id2i[node_id]
+    
+    def id_of(self, iloc):
+        """Renvoie l'identifiant d'un nœud à partir de son indice interne."""
+        return self._ids[iloc]
     
     def set_start_node(self, node_id):
         """Définit le nœud de départ de la recherche."""
-        if node_id in self.graph.nodes:
+        if node_id in self._id2i:
             self.start_node = node_id
         else:
             raise ValueError(f"Le nœud {node_id} n'existe pas dans le graphe")
     
     def set_goal_node(self, node_id):
         """Définit le nœud objectif de la recherche."""
-        if node_id in self.graph.nodes:
+        if node_id in self._id2i:
             self.goal_node = node_id
         else:
             raise ValueError(f"Le nœud {node_id} n'existe pas dans le graphe")
     
-    def get_heuristic(self, node_id):
-        """Récupère la valeur heuristique d'un nœud."""
-        return self.graph.nodes[node_id]['heuristic']
+    def get_heuristic(self, i):
+        """
+        Récupère la valeur heuristique d'un nœud à partir de son indice interne.
+        
+        i peut aussi être un tableau d'indices (par exemple le résultat de
+        get_neighbors) : les heuristiques sont alors renvoyées en un seul accès.
+        """
+        self.finalize()
+        return self._heur[i]
+    
+    def get_neighbors(self, i):
+        """
+        Récupère les indices internes de tous les voisins d'un nœud.
+        
+        Renvoie une vue (sans copie) sur le tableau CSR : elle ne doit pas être modifiée.
+        """
+        self.finalize()
+        return self._indices[self._indptr[i]:self._indptr[i + 1]]
     
-    def get_neighbors(self, node_id):
-        """Récupère tous les voisins d'un nœud."""
-        return list(self.graph.successors(node_id))
+    def neighbor_weights(self, i):
+        """Récupère les poids des arêtes sortantes d'un nœud, dans l'ordre de get_neighbors."""
+        self.finalize()
+        return self._weights[self._indptr[i]:self._indptr[i + 1]]
     
-    def get_edge_weight(self, from_node_id, to_node_id):
-        """Récupère le poids d'une arête entre deux nœuds."""
-        return self.graph[from_node_id][to_node_id]['weight']
+    def get_edge_weight(self, i, j):
+        """Récupère le poids d'une arête entre deux nœuds (indices internes)."""
+        self.finalize()
+        start, end = self._indptr[i], self._indptr[i + 1]
+        
+        k = np.flatnonzero(self._indices[start:end] == j)
+        if not len(k):
+            raise KeyError((self._ids[i], self._ids[j]))
+        return self._weights[start + k[0]]
     
     def save_to_file(self, filename):
         """
         Sauvegarde le graphe dans un fichier JSON.
         
+        Le graphe est écrit directement sous forme CSR (ids, heuristic, indptr,
+        indices, weights), sérialisé par orjson depuis les tableaux numpy. Les
+        nœuds sont écrits dans leur ordre d'ajout d'origine (voir _rank) : le
+        fichier ne dépend pas de la renumérotation faite au chargement.
+        orjson écrivant null pour inf et NaN, un graphe dont une heuristique ou
+        un poids n'est pas fini est écrit avec le module json (Infinity, NaN).
+        
         Args:
             filename: Chemin du fichier pour sauvegarder le graphe
         """
+        self.finalize()
+        n = len(self._ids)
+        order = np.argsort(self._rank)
+        new_iloc = np.empty(n, dtype=INDEX_DTYPE)
+        new_iloc[order] = np.arange(n, dtype=INDEX_DTYPE)
+        
+        src = new_iloc[np.repeat(np.arange(n), np.diff(self._indptr))]
+        indptr, indices, weights = self._build_csr(n, src, new_iloc[self._indices], self._weights)
+        
         graph_data = {
-            'nodes': [
-                {
-                    'id': node,
-                    'heuristic': self.graph.nodes[node]['heuristic']
-                } 
-                for node in self.graph.nodes
-            ],
-            'edges': [
-                {
-                    'from': edge[0],
-                    'to': edge[1],
-                    'weight': self.graph.edges[edge]['weight']
-                }
-                for edge in self.graph.edges
-            ],
+            'ids': [self._ids[i] for i in order.tolist()],
+            'heuristic': self._heur[order],
+            'indptr': indptr,
+            'indices': indices,
+            'weights': weights,
             'start_node': self.start_node,
             'goal_node': self.goal_node
         }
         
-        with open(filename, 'w') as file:
-            json.dump(graph_data, file, indent=4)
+        if np.isfinite(graph_data['heuristic']).all() and np.isfinite(weights).all():
+            content = orjson.dumps(graph_data, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            for key in ('heuristic', 'indptr', 'indices', 'weights'):
+                graph_data[key] = graph_data[key].tolist()
+            content = json.dumps(graph_data).encode()
+        
+        with open(filename, 'wb') as file:
+            file.write(content)
     
     @classmethod
     def load_from_file(cls, filename):
         """
         Charge un graphe depuis un fichier JSON.
         
+        Accepte le format CSR écrit par save_to_file ainsi que le format
+        historique à listes 'nodes' / 'edges' (voir example_graphs).
+        
         Args:
             filename: Chemin du fichier à charger
             
         Returns:
             Graph: Une instance de graphe chargée depuis le fichier
         """
-        with open(filename, 'r') as file:
-            graph_data = json.load(file)
+        with open(filename, 'rb') as file:
+            content = file.read()
+        
+        try:
+            graph_data = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson refuse Infinity / NaN, acceptés par le module json
+            graph_data = json.loads(content)
         
         graph = cls()
         
-        # Ajouter les nœuds
-        for node_data in graph_data['nodes']:
-            graph.add_node(node_data['id'], node_data['heuristic'])
+        if 'indptr' in graph_data:
+            # Format CSR : les tableaux sont repris tels quels
+            graph._ids = list(graph_data['ids'])
+            graph._id2i = {node_id: i for i, node_id in enumerate(graph._ids)}
+            graph._heur = np.asarray(graph_data['heuristic'], dtype=VALUE_DTYPE)
+            graph._indptr = np.asarray(graph_data['indptr'], dtype=INDEX_DTYPE)
+            graph._indices = np.asarray(graph_data['indices'], dtype=INDEX_DTYPE)
+            graph._weights = np.asarray(graph_data['weights'], dtype=VALUE_DTYPE)
+            if len(graph._indptr) != len(graph._ids) + 1 or len(graph._indices) != len(graph._weights):
+                raise ValueError(f"Tableaux CSR incohérents dans {filename}")
+        else:
+            # Format 'nodes' / 'edges' : construction directe des tableaux, sans
+            # passer par add_node / add_edge pour chaque élément
+            nodes = graph_data['nodes']
+            edges = graph_data['edges']
+            
+            id2i = {}
+            node_ilocs = np.fromiter((id2i.setdefault(node['id'], len(id2i)) for node in nodes), dtype=np.intp, count=len(nodes))
+            
+            # Comme add_edge, les extrémités absentes de 'nodes' sont créées
+            src = np.fromiter((id2i.setdefault(edge['from'], len(id2i)) for edge in edges), dtype=INDEX_DTYPE, count=len(edges))
+            dst = np.fromiter((id2i.setdefault(edge['to'], len(id2i)) for edge in edges), dtype=INDEX_DTYPE, count=len(edges))
+            weights = np.fromiter((edge['weight'] for edge in edges), dtype=VALUE_DTYPE, count=len(edges))
+            
+            graph._id2i = id2i
+            graph._ids = list(id2i)
+            graph._heur = np.zeros(len(id2i), dtype=VALUE_DTYPE)
+            graph._heur[node_ilocs] = np.fromiter((node['heuristic'] for node in nodes), dtype=VALUE_DTYPE, count=len(nodes))
+            graph._indptr, graph._indices, graph._weights = cls._build_csr(len(id2i), src, dst, weights)
         
-        # Ajouter les arêtes
-        for edge_data in graph_data['edges']:
-            graph.add_edge(edge_data['from'], edge_data['to'], edge_data['weight'])
+        graph._rank = np.arange(len(graph._ids), dtype=INDEX_DTYPE)
+        graph._reorder_nodes()
+        graph._sort_neighbors()
         
         # Définir les nœuds de départ et d'arrivée
         if graph_data.get('start_node'):
@@ -118,4 +433,5 @@ class Graph:
         if graph_data.get('goal_node'):
             graph.set_goal_node(graph_data['goal_node'])
         
-        return graph
\ No newline at end of file
+        graph.finalize()
+        return graph
@@ -8,6 +8,7 @@ import json
 import tkinter as tk
 from tkinter import filedialog, messagebox, simpledialog
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
 
 class BestFirstSearchApp:
     """
@@ -62,17 +63,37 @@ class BestFirstSearchApp:
         self.graph_frame = tk.Frame(main_frame, bg="#ffffff", bd=2, relief=tk.GROOVE)
         self.graph_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        # Zone de texte pour les informations
-        self.info_text = tk.Text(
+        # Figure matplotlib intégrée dans tkinter, créée une seule fois et
+        # redessinée à chaque affichage
+        self._fig = Figure(figsize=(12, 8), facecolor="#ffffff")
+        self._ax = self._fig.add_subplot()
+        self._ax.axis('off')
+        self._canvas = FigureCanvasTkAgg(self._fig, master=self.graph_frame)
+        
+        # Ajouter une barre d'outils pour naviguer dans le graphique ; elle se
+        # place elle-même en bas, le canvas est packé une seule fois ensuite
+        self._toolbar = NavigationToolbar2Tk(self._canvas, self.graph_frame)
+        self._toolbar.update()
+        self._canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        # Zone d'information : un Label lié à une StringVar, mis à jour en un seul appel
+        self._info_var = tk.StringVar()
+        self.info_text = tk.Label(
             main_frame,
+            textvariable=self._info_var,
             height=8,
             font=("Consolas", 12),
             bg="#ffffff",        # Fond blanc pour la console utilisateur
             fg="#232946",        # Texte foncé pour le contraste
             bd=0,
-            relief=tk.FLAT
+            relief=tk.FLAT,
+            justify=tk.LEFT,
+            anchor="nw"
         )
         self.info_text.pack(fill=tk.X, pady=5)
+        # Renvoyer à la ligne les messages longs (liste des nœuds explorés)
+        # selon la largeur courante du Label
+        self.info_text.bind("<Configure>", lambda event: self.info_text.config(wraplength=event.width))
         
         # Message initial
         self.update_info("Bienvenue dans le visualiseur de Best-First Search !\n"
@@ -80,10 +101,7 @@ class BestFirstSearchApp:
         
     def update_info(self, message):
         """Met à jour la zone d'information avec un message."""
-        self.info_text.config(state=tk.NORMAL)
-        self.info_text.delete(1.0, tk.END)
-        self.info_text.insert(tk.END, message)
-        self.info_text.config(state=tk.DISABLED)
+        self._info_var.set(message)
     
     def load_graph(self):
         """Charge un graphe depuis un fichier JSON."""
@@ -127,22 +145,15 @@ class BestFirstSearchApp:
     
     def display_graph(self):
         """Affiche le graphe dans l'interface."""
-        # Effacer les widgets existants dans le frame du graphe
-        for widget in self.graph_frame.winfo_children():
-            widget.destroy()
-        
         if self.graph and self.visualizer:
-            fig, ax = self.visualizer.draw_graph("Graphe initial")
-            
-            # Intégrer la figure matplotlib dans tkinter
-            canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-            
-            # Ajouter une barre d'outils pour naviguer dans le graphique
-            toolbar = NavigationToolbar2Tk(canvas, self.graph_frame)
-            toolbar.update()
-            canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+            # Redessiner dans la figure existante
+            self.visualizer.draw_graph("Graphe initial", ax=self._ax)
+            self._refresh_canvas()
+    
+    def _refresh_canvas(self):
+        """Planifie le rafraîchissement du canvas (redessiné une seule fois, au repos de Tk)."""
+        self._canvas.draw_idle()
+        self._toolbar.update()
     
     def run_bfs(self):
         """Exécute l'algorithme Best-First Search et affiche les résultats."""
@@ -151,31 +162,20 @@ class BestFirstSearchApp:
             return
         
         try:
-            # Exécuter l'algorithme
+            # Exécuter l'algorithme (les étapes ne servent qu'à l'animation)
             bfs = BestFirstSearch(self.graph)
-            path, expanded_nodes, steps = bfs.search()
+            path, expanded_nodes, steps = bfs.search(record_steps=False)
             self.results = (path, expanded_nodes, steps)
             
             # Afficher le chemin trouvé
-            for widget in self.graph_frame.winfo_children():
-                widget.destroy()
-            
             if path:
-                fig, ax = self.visualizer.visualize_path(path, "Chemin trouvé par Best-First Search")
-                
-                # Intégrer la figure matplotlib dans tkinter
-                canvas = FigureCanvasTkAgg(fig, master=self.graph_frame)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-                
-                # Ajouter une barre d'outils pour naviguer dans le graphique
-                toolbar = NavigationToolbar2Tk(canvas, self.graph_frame)
-                toolbar.update()
-                canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+                # Redessiner dans la figure existante
+                self.visualizer.visualize_path(path, "Chemin trouvé par Best-First Search", ax=self._ax)
+                self._refresh_canvas()
                 
-                # Mise à jour des informations
-                path_str = " → ".join(path)
-                expanded_str = " → ".join(expanded_nodes)
+                # Mise à jour des informations (indices internes -> identifiants)
+                path_str = " → ".join(self.graph.id_of(i) for i in path)
+                expanded_str = " → ".join(self.graph.id_of(i) for i in expanded_nodes)
                 
                 self.update_info(f"Chemin trouvé : {path_str}\n"
                               f"Nœuds explorés : {expanded_str}\n"
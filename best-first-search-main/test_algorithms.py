@@ -0,0 +1,98 @@
+import heapq
+import random
+import unittest
+
+from algorithms import BestFirstSearch
+from algorithms_numba import NUMBA_AVAILABLE
+from graph import Graph
+
+
+def baseline_search(heuristics, edges, start, goal):
+    """
+    Best-First Search de référence sur les identifiants, avec des tuples
+    (heuristique, nœud, parent) comme la version d'origine.
+    """
+    neighbors = {node: [] for node in heuristics}
+    for from_node, to_node in edges:
+        neighbors[from_node].append(to_node)
+
+    open_set = [(heuristics[start], start, "")]
+    visited = set()
+    parents = {}
+    expanded = []
+    while open_set:
+        _, current, parent = heapq.heappop(open_set)
+        if current in visited:
+            continue
+        visited.add(current)
+        expanded.append(current)
+        if parent:
+            parents[current] = parent
+        if current == goal:
+            path = [current]
+            while path[-1] in parents:
+                path.append(parents[path[-1]])
+            return path[::-1], expanded
+        for neighbor in neighbors[current]:
+            if neighbor not in visited:
+                heapq.heappush(open_set, (heuristics[neighbor], neighbor, current))
+    return None, expanded
+
+
+def build_graph(heuristics, edges, start, goal):
+    graph = Graph()
+    for node_id, heuristic in heuristics.items():
+        graph.add_node(node_id, heuristic)
+    for from_node, to_node in edges:
+        graph.add_edge(from_node, to_node)
+    graph.set_start_node(start)
+    graph.set_goal_node(goal)
+    return graph
+
+
+def run_search(graph, record_steps):
+    path, expanded, _ = BestFirstSearch(graph).search(record_steps=record_steps)
+    if path is not None:
+        path = [graph.id_of(i) for i in path]
+    return path, [graph.id_of(i) for i in expanded]
+
+
+class TieBreakingTest(unittest.TestCase):
+
+    def assert_matches_baseline(self, heuristics, edges, start, goal):
+        expected = baseline_search(heuristics, edges, start, goal)
+        graph = build_graph(heuristics, edges, start, goal)
+        modes = [True, False] if NUMBA_AVAILABLE else [True]
+        for record_steps in modes:
+            with self.subTest(record_steps=record_steps):
+                self.assertEqual(run_search(graph, record_steps), expected)
+
+    def test_ties_follow_id_order(self):
+        heuristics = {'S': 14, 'A': 10, 'B': 20, 'C': 7, 'G': 0}
+        edges = [('S', 'B'), ('S', 'C'), ('A', 'G'), ('B', 'C'), ('B', 'G'), ('C', 'B'), ('G', 'C')]
+        self.assert_matches_baseline(heuristics, edges, 'S', 'G')
+        graph = build_graph(heuristics, edges, 'S', 'G')
+        self.assertEqual(run_search(graph, True)[0], ['S', 'C', 'B', 'G'])
+
+    def test_mixed_id_types(self):
+        # Identifiants non comparables entre eux : les heuristiques ne sont
+        # jamais égales, la recherche d'origine fonctionnait
+        heuristics = {'A': 1, 2: 0}
+        edges = [('A', 2)]
+        self.assert_matches_baseline(heuristics, edges, 'A', 2)
+
+    def test_random_graphs(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            n = rng.randint(2, 30)
+            ids = [f"N{k}" for k in rng.sample(range(1000), n)]
+            # Peu de valeurs distinctes pour multiplier les égalités
+            heuristics = {node_id: float(rng.randint(0, 4)) for node_id in ids}
+            edges = list({(rng.choice(ids), rng.choice(ids)) for _ in range(rng.randint(1, 4 * n))})
+            edges = [(a, b) for a, b in edges if a != b]
+            start, goal = rng.sample(ids, 2)
+            self.assert_matches_baseline(heuristics, edges, start, goal)
+
+
+if __name__ == '__main__':
+    unittest.main()
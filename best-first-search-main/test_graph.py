@@ -0,0 +1,125 @@
+import json
+import math
+import os
+import random
+import tempfile
+import unittest
+
+from graph import Graph
+
+
+def heuristics_by_id(graph):
+    return {graph.id_of(i): float(graph.get_heuristic(i)) for i in range(len(graph._ids))}
+
+
+def edges_by_id(graph):
+    return {
+        (graph.id_of(i), graph.id_of(j)): float(w)
+        for i in range(len(graph._ids))
+        for j, w in zip(graph.get_neighbors(i).tolist(), graph.neighbor_weights(i).tolist())
+    }
+
+
+class SaveLoadTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmpdir.name, name)
+
+    def write_json(self, name, data):
+        with open(self.path(name), 'w') as file:
+            json.dump(data, file)
+        return self.path(name)
+
+    def read_bytes(self, name):
+        with open(self.path(name), 'rb') as file:
+            return file.read()
+
+    def test_save_load_save_is_identical(self):
+        graph = Graph.load_from_file(os.path.join(os.path.dirname(__file__), 'example_graphs', 'ex2.json'))
+        graph.save_to_file(self.path('a.json'))
+        Graph.load_from_file(self.path('a.json')).save_to_file(self.path('b.json'))
+        self.assertEqual(self.read_bytes('a.json'), self.read_bytes('b.json'))
+
+    def test_infinite_heuristic_round_trip(self):
+        graph = Graph()
+        graph.add_node('A', math.inf)
+        graph.add_node('B', 1)
+        graph.add_edge('A', 'B', 2)
+        graph.save_to_file(self.path('inf.json'))
+
+        loaded = Graph.load_from_file(self.path('inf.json'))
+        self.assertEqual(heuristics_by_id(loaded), {'A': math.inf, 'B': 1.0})
+        self.assertEqual(edges_by_id(loaded), {('A', 'B'): 2.0})
+
+    def test_empty_graph(self):
+        filename = self.write_json('empty.json', {'nodes': [], 'edges': []})
+        graph = Graph.load_from_file(filename)
+        graph.save_to_file(self.path('saved.json'))
+
+        loaded = Graph.load_from_file(self.path('saved.json'))
+        self.assertEqual(loaded._ids, [])
+        self.assertEqual(edges_by_id(loaded), {})
+
+    def test_ilocs_stable_after_load(self):
+        graph = Graph.load_from_file(os.path.join(os.path.dirname(__file__), 'example_graphs', 'ex1.json'))
+        ilocs = {node_id: graph.iloc_of(node_id) for node_id in graph._ids}
+
+        graph.add_node('Z', 5)
+        for node_id in ilocs:
+            graph.add_edge('Z', node_id, 1)
+        graph.finalize()
+
+        self.assertEqual({node_id: graph.iloc_of(node_id) for node_id in ilocs}, ilocs)
+        self.assertTrue(all(graph.id_of(i) == node_id for node_id, i in ilocs.items()))
+
+    def test_legacy_format(self):
+        # 'D' et 'E' n'apparaissent que dans les arêtes
+        data = {
+            'nodes': [{'id': 'A', 'heuristic': 3}, {'id': 'B', 'heuristic': 1.5}, {'id': 'C', 'heuristic': 0}],
+            'edges': [
+                {'from': 'A', 'to': 'B', 'weight': 2},
+                {'from': 'B', 'to': 'D', 'weight': 4},
+                {'from': 'E', 'to': 'C', 'weight': 1},
+                {'from': 'A', 'to': 'B', 'weight': 7},
+            ],
+            'start_node': 'A',
+            'goal_node': 'C'
+        }
+        graph = Graph.load_from_file(self.write_json('legacy.json', data))
+
+        self.assertEqual(heuristics_by_id(graph), {'A': 3.0, 'B': 1.5, 'C': 0.0, 'D': 0.0, 'E': 0.0})
+        self.assertEqual(edges_by_id(graph), {('A', 'B'): 7.0, ('B', 'D'): 4.0, ('E', 'C'): 1.0})
+        self.assertEqual((graph.start_node, graph.goal_node), ('A', 'C'))
+
+
+class ReorderTest(unittest.TestCase):
+
+    def test_load_is_a_pure_permutation(self):
+        rng = random.Random(0)
+        ids = [f"N{k}" for k in range(200)]
+        heuristics = {node_id: float(rng.randint(0, 20)) for node_id in ids}
+        edges = {(rng.choice(ids), rng.choice(ids)): float(rng.randint(1, 9)) for _ in range(800)}
+        data = {
+            'nodes': [{'id': node_id, 'heuristic': h} for node_id, h in heuristics.items()],
+            'edges': [{'from': a, 'to': b, 'weight': w} for (a, b), w in edges.items()],
+        }
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'random.json')
+            with open(filename, 'w') as file:
+                json.dump(data, file)
+            graph = Graph.load_from_file(filename)
+
+        self.assertEqual(sorted(graph._ids), sorted(ids))
+        self.assertEqual(heuristics_by_id(graph), heuristics)
+        self.assertEqual(edges_by_id(graph), edges)
+        for i in range(len(ids)):
+            neighbor_heuristics = graph.get_heuristic(graph.get_neighbors(i)).tolist()
+            self.assertEqual(neighbor_heuristics, sorted(neighbor_heuristics))
+
+
+if __name__ == '__main__':
+    unittest.main()
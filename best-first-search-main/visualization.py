@@ -1,6 +1,8 @@
 import matplotlib.pyplot as plt
 import networkx as nx
 import matplotlib.animation as animation
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 import numpy as np
 
 class GraphVisualizer:
@@ -18,209 +20,247 @@ class GraphVisualizer:
         self.fig = None
         self.ax = None
         self.pos = None
+        self._layout_version = None
+        self._colors_key = None
+        self._static_key = None
+        self._update_caches()
+    
+    def _update_caches(self):
+        """
+        Met à jour les données de dessin qui ne changent pas d'une image à l'autre.
         
-    def draw_graph(self, title="Graphe"):
+        Positions (spring_layout), labels et couleurs de base ne sont recalculés
+        que si le graphe a été modifié (Graph._version) ou si les nœuds de départ
+        et d'arrivée ont changé.
+        """
+        graph_nx = self.graph.graph
+        if self._layout_version != self.graph._version:
+            self.pos = nx.spring_layout(graph_nx, seed=42)
+            self._pos_array = np.array([self.pos[node] for node in range(graph_nx.number_of_nodes())]).reshape(-1, 2)
+            self._edge_labels = {(u, v): f"{d['weight']:g}" for u, v, d in graph_nx.edges(data=True)}
+            self._node_labels = {node: f"{data['label']}\nh={data['heuristic']:g}" for node, data in graph_nx.nodes(data=True)}
+            self._layout_version = self.graph._version
+            self._colors_key = None
+        
+        colors_key = (self.graph.start_node, self.graph.goal_node)
+        if self._colors_key != colors_key:
+            # Couleurs de base (remplissage, bordure) indexées par iloc ; les nœuds
+            # sont toujours dessinés avec nodelist=range(n) pour suivre cet ordre
+            n = graph_nx.number_of_nodes()
+            self._node_colors = np.tile(to_rgba("#21e6c1"), (n, 1))  # Turquoise
+            self._node_border_colors = np.tile(to_rgba("#146356"), (n, 1))
+            self._special_ilocs = []
+            if self.graph.start_node is not None:
+                start = self.graph.iloc_of(self.graph.start_node)
+                self._node_colors[start] = to_rgba("#274690")  # Bleu foncé
+                self._node_border_colors[start] = to_rgba("#142850")
+                self._special_ilocs.append(start)
+            if self.graph.goal_node is not None:
+                goal = self.graph.iloc_of(self.graph.goal_node)
+                self._node_colors[goal] = to_rgba("#f9a826")  # Orange
+                self._node_border_colors[goal] = to_rgba("#c97d10")
+                self._special_ilocs.append(goal)
+            self._colors_key = colors_key
+        
+    def draw_graph(self, title="Graphe", ax=None):
         """
         Dessine le graphe avec les nœuds et les arêtes.
         
         Args:
             title: Titre du graphique
+            ax: Axes existants dans lesquels redessiner (par exemple ceux de
+                l'interface Tk) ; si None, une nouvelle figure est créée
         """
-        self.fig, self.ax = plt.subplots(figsize=(12, 8))
-        graph_nx = self.graph.graph
+        # Positions, labels et couleurs calculés une seule fois
+        self._update_caches()
         
-        # Utiliser spring_layout pour positionner les nœuds automatiquement
-        self.pos = nx.spring_layout(graph_nx, seed=42)
-        
-        # Couleurs et styles personnalisés
-        node_colors = []
-        node_border_colors = []
-        for node in graph_nx.nodes():
-            if node == self.graph.start_node:
-                node_colors.append("#274690")  # Bleu foncé
-                node_border_colors.append("#142850")
-            elif node == self.graph.goal_node:
-                node_colors.append("#f9a826")  # Orange
-                node_border_colors.append("#c97d10")
-            else:
-                node_colors.append("#21e6c1")  # Turquoise
-                node_border_colors.append("#146356")
-        
-        # Dessiner les arêtes avec style
-        nx.draw_networkx_edges(
-            graph_nx, self.pos, arrows=True, arrowsize=25, width=2.5, edge_color="#393e46", style="dashed", ax=self.ax
-        )
-        # Labels des arêtes
-        edge_labels = {(u, v): f"{d['weight']}" for u, v, d in graph_nx.edges(data=True)}
-        nx.draw_networkx_edge_labels(
-            graph_nx, self.pos, edge_labels=edge_labels, font_color="#f9a826", font_size=12, ax=self.ax
-        )
-        # Labels des nœuds
-        node_labels = {node: f"{node}\nh={graph_nx.nodes[node]['heuristic']}" for node in graph_nx.nodes()}
-        # Nœuds avec bordures
-        nx.draw_networkx_nodes(
-            graph_nx, self.pos, node_color=node_colors, node_size=900, edgecolors=node_border_colors, linewidths=3, ax=self.ax
-        )
-        nx.draw_networkx_labels(
-            graph_nx, self.pos, labels=node_labels, font_size=13, font_color="#232946", font_weight="bold", ax=self.ax
-        )
-        plt.title(title, fontsize=18, color="#f9a826", fontweight="bold")
-        plt.axis('off')
+        if ax is None:
+            self.fig, self.ax = plt.subplots(figsize=(12, 8))
+            self._static_key = None
+        else:
+            # La couche statique (arêtes, nœuds, labels) déjà dessinée dans ces
+            # axes est réutilisée : seuls les éléments du chemin sont retirés
+            if self._static_key != (id(ax), self._layout_version) or self._node_collection not in ax.collections:
+                ax.clear()
+                self._static_key = None
+            self.fig, self.ax = ax.figure, ax
+        
+        if self._static_key is None:
+            graph_nx = self.graph.graph
+            
+            # Dessiner les arêtes avec style
+            nx.draw_networkx_edges(
+                graph_nx, self.pos, arrows=True, arrowsize=25, width=2.5, edge_color="#393e46", style="dashed", ax=self.ax
+            )
+            # Labels des arêtes
+            nx.draw_networkx_edge_labels(
+                graph_nx, self.pos, edge_labels=self._edge_labels, font_color="#f9a826", font_size=12, ax=self.ax
+            )
+            # Nœuds avec bordures
+            self._node_collection = nx.draw_networkx_nodes(
+                graph_nx, self.pos, nodelist=range(graph_nx.number_of_nodes()), node_color=self._node_colors, node_size=900, edgecolors=self._node_border_colors, linewidths=3, ax=self.ax
+            )
+            # Labels des nœuds
+            nx.draw_networkx_labels(
+                graph_nx, self.pos, labels=self._node_labels, font_size=13, font_color="#232946", font_weight="bold", ax=self.ax
+            )
+            self._path_artists = []
+            self._static_key = (id(self.ax), self._layout_version)
+        else:
+            for artist in self._path_artists:
+                artist.remove()
+            self._path_artists = []
+            # Les nœuds de départ et d'arrivée ont pu changer
+            self._node_collection.set_facecolors(self._node_colors)
+            self._node_collection.set_edgecolors(self._node_border_colors)
+        
+        self.ax.set_title(title, fontsize=18, color="#f9a826", fontweight="bold")
+        self.ax.axis('off')
         self.fig.patch.set_facecolor("#ffffff")  # Fond blanc figure
         self.ax.set_facecolor("#ffffff")         # Fond blanc axes
         return self.fig, self.ax
     
-    def visualize_path(self, path, title="Chemin trouvé par Best-First Search"):
+    def visualize_path(self, path, title="Chemin trouvé par Best-First Search", ax=None):
         """
         Visualise le chemin trouvé par l'algorithme.
         
         Args:
-            path: Liste des nœuds formant le chemin solution
+            path: Liste des indices internes des nœuds formant le chemin solution
             title: Titre du graphique
+            ax: Axes existants dans lesquels redessiner (voir draw_graph)
         """
         if path is None:
             print("Aucun chemin trouvé.")
             return
         
-        fig, ax = self.draw_graph(title)
+        fig, ax = self.draw_graph(title, ax=ax)
         
         # Créer une liste des arêtes du chemin pour les mettre en évidence
         path_edges = [(path[i], path[i+1]) for i in range(len(path)-1)]
         
-        # Mettre en évidence les arêtes du chemin
-        nx.draw_networkx_edges(
+        # Mettre en évidence les arêtes du chemin (retirées au prochain dessin)
+        self._path_artists.extend(nx.draw_networkx_edges(
             self.graph.graph, self.pos, edgelist=path_edges, edge_color="#a259f7", width=5, style="solid", ax=ax
-        )
+        ))
         
         # Mettre en évidence les nœuds du chemin (hors départ/arrivée)
         path_nodes = path[1:-1]
         if path_nodes:
-            nx.draw_networkx_nodes(
+            self._path_artists.append(nx.draw_networkx_nodes(
                 self.graph.graph, self.pos, nodelist=path_nodes, node_color="#a259f7", node_size=1100, edgecolors="#232946", linewidths=4, ax=ax
-            )
+            ))
         
         fig.patch.set_facecolor("#ffffff")  # Fond blanc figure
         ax.set_facecolor("#ffffff")         # Fond blanc axes
         return fig, ax
     
-    def animate_search(self, steps, path, interval=1000, save_animation=False, filename='search_animation.mp4'):
+    def animate_search(self, steps, path, interval=1000, save_animation=False, filename='search_animation.mp4', stride=1):
         """
         Crée une animation de l'algorithme de recherche.
         
         Args:
-            steps: Liste des états à chaque étape de l'algorithme
-            path: Chemin final trouvé
+            steps: Liste des états à chaque étape de l'algorithme (indices internes)
+            path: Chemin final trouvé (indices internes)
             interval: Intervalle entre les images en millisecondes
             save_animation: Si True, sauvegarde l'animation dans un fichier
             filename: Nom du fichier pour sauvegarder l'animation
+            stride: N'affiche qu'une étape sur stride (la dernière étape, où le
+                but est atteint, est toujours affichée)
             
         Returns:
             Animation
         """
+        if stride < 1:
+            raise ValueError(f"stride doit être un entier supérieur ou égal à 1 (reçu : {stride})")
+        
+        self._update_caches()
         fig, ax = plt.subplots(figsize=(12, 8))
         
+        # Étapes affichées : BestFirstSearch.search s'arrête déjà sur le but,
+        # la dernière étape est donc la dernière image utile
+        total_steps = len(steps)
+        step_numbers = list(range(0, total_steps, stride))
+        if step_numbers and step_numbers[-1] != total_steps - 1:
+            step_numbers.append(total_steps - 1)
+        steps = [steps[k] for k in step_numbers]
+        
+        # Données propres à chaque image, calculées une seule fois
+        visited_ilocs = [np.array(step['visited'], dtype=np.intp) for step in steps]
+        visited_strs = [', '.join(self.graph.id_of(node) for node in step['visited']) for step in steps]
+        path_ilocs = [np.array(step['path_so_far'], dtype=np.intp) for step in steps]
+        path_segments_by_frame = [np.stack([self._pos_array[p[:-1]], self._pos_array[p[1:]]], axis=1) for p in path_ilocs]
+        path_offsets_by_frame = [self._pos_array[p[1:-1]] for p in path_ilocs]
+        goal = self.graph.iloc_of(self.graph.goal_node)
+        
+        # Artistes modifiés à chaque image, créés par init : propres à cette
+        # animation, ils sont conservés pour être mis à jour sans être recréés
+        anim = {}
+        
         def init():
             ax.clear()
             graph_nx = self.graph.graph
             
-            # Dessiner les arêtes
+            # Couche statique, dessinée une seule fois : arêtes et poids
             nx.draw_networkx_edges(graph_nx, self.pos, arrows=True, arrowsize=25, width=2.5, edge_color="#393e46", style="dashed", ax=ax)
+            nx.draw_networkx_edge_labels(graph_nx, self.pos, edge_labels=self._edge_labels, font_color="#f9a826", font_size=12, ax=ax)
             
-            # Dessiner les nœuds avec leur label et valeur heuristique
-            node_labels = {node: f"{node}\nh={graph_nx.nodes[node]['heuristic']}" for node in graph_nx.nodes()}
-            
-            # Couleurs spéciales pour les nœuds
-            node_colors = []
-            node_border_colors = []
-            for node in graph_nx.nodes():
-                if node == self.graph.start_node:
-                    node_colors.append("#274690")
-                    node_border_colors.append("#142850")
-                elif node == self.graph.goal_node:
-                    node_colors.append("#f9a826")
-                    node_border_colors.append("#c97d10")
-                else:
-                    node_colors.append("#21e6c1")
-                    node_border_colors.append("#146356")
+            # Le titre, hors de la zone des axes, reste fixe : le blitting ne
+            # redessine que l'intérieur des axes
+            ax.set_title("Exécution de Best-First Search", fontsize=18, color="#f9a826", fontweight="bold")
             
-            nx.draw_networkx_nodes(graph_nx, self.pos, node_color=node_colors, node_size=900, edgecolors=node_border_colors, linewidths=3, ax=ax)
-            nx.draw_networkx_labels(graph_nx, self.pos, labels=node_labels, font_size=13, font_color="#232946", font_weight="bold", ax=ax)
+            anim['path_lc'] = LineCollection([], colors="#a259f7", linewidths=5, linestyles="solid")
+            ax.add_collection(anim['path_lc'])
+            anim['nodes'] = nx.draw_networkx_nodes(graph_nx, self.pos, nodelist=range(graph_nx.number_of_nodes()), node_color=self._node_colors, node_size=900, edgecolors=self._node_border_colors, linewidths=3, ax=ax)
+            anim['path_nodes'] = ax.scatter([], [], s=1100, c="#a259f7", edgecolors="#232946", linewidths=4, zorder=2)
+            node_labels = list(nx.draw_networkx_labels(graph_nx, self.pos, labels=self._node_labels, font_size=13, font_color="#232946", font_weight="bold", ax=ax).values())
+            anim['info'] = ax.text(0.02, 0.02, "", transform=ax.transAxes, fontsize=12, color="#eebbc3",
+                                   bbox=dict(facecolor='#232946', edgecolor='#f9a826', boxstyle='round,pad=0.5', alpha=0.8))
+            anim['info'].set_visible(False)
             
-            # Dessiner les poids des arêtes
-            edge_labels = {(u, v): f"{d['weight']}" for u, v, d in graph_nx.edges(data=True)}
-            nx.draw_networkx_edge_labels(graph_nx, self.pos, edge_labels=edge_labels, font_color="#f9a826", font_size=12, ax=ax)
+            # Artistes redessinés à chaque image ; les labels des nœuds sont
+            # inclus pour rester au-dessus des nœuds
+            anim['artists'] = [anim['path_lc'], anim['nodes'], anim['path_nodes'], *node_labels, anim['info']]
             
-            ax.set_title("Exécution de Best-First Search", fontsize=18, color="#f9a826", fontweight="bold")
             ax.axis('off')
             fig.patch.set_facecolor("#ffffff")  # Fond blanc figure
             ax.set_facecolor("#ffffff")         # Fond blanc axes
-            return []
+            return anim['artists']
         
         def update(frame_num):
-            ax.clear()
-            step = steps[frame_num] if frame_num < len(steps) else steps[-1]
-            
-            graph_nx = self.graph.graph
+            step = steps[frame_num]
             
-            # Dessiner toutes les arêtes normales
-            nx.draw_networkx_edges(graph_nx, self.pos, arrows=True, arrowsize=25, width=2.5, edge_color="#393e46", style="dashed", ax=ax)
-            
-            # Dessiner les poids des arêtes
-            edge_labels = {(u, v): f"{d['weight']}" for u, v, d in graph_nx.edges(data=True)}
-            nx.draw_networkx_edge_labels(graph_nx, self.pos, edge_labels=edge_labels, font_color="#f9a826", font_size=12, ax=ax)
-            
-            # Préparer les couleurs des nœuds selon leur état
-            node_colors = []
-            node_border_colors = []
-            for node in graph_nx.nodes():
-                if node == self.graph.start_node:
-                    node_colors.append("#274690")
-                    node_border_colors.append("#142850")
-                elif node == self.graph.goal_node:
-                    node_colors.append("#f9a826")
-                    node_border_colors.append("#c97d10")
-                elif node == step['current']:
-                    node_colors.append("#ff5e5b")  # Nœud actuel : rouge vif
-                    node_border_colors.append("#c81d25")
-                elif node in step['visited']:
-                    node_colors.append("#b2bec3")  # Gris clair pour exploré
-                    node_border_colors.append("#636e72")
-                else:
-                    node_colors.append("#21e6c1")
-                    node_border_colors.append("#146356")
-            
-            # Dessiner tous les nœuds
-            nx.draw_networkx_nodes(graph_nx, self.pos, node_color=node_colors, node_size=900, edgecolors=node_border_colors, linewidths=3, ax=ax)
-            
-            # Dessiner les labels des nœuds
-            node_labels = {node: f"{node}\nh={graph_nx.nodes[node]['heuristic']}" for node in graph_nx.nodes()}
-            nx.draw_networkx_labels(graph_nx, self.pos, labels=node_labels, font_size=13, font_color="#232946", font_weight="bold", ax=ax)
+            # Couleurs des nœuds selon leur état : explorés en gris, nœud actuel
+            # en rouge, départ et arrivée gardent leur couleur de base
+            node_colors = self._node_colors.copy()
+            node_border_colors = self._node_border_colors.copy()
+            node_colors[visited_ilocs[frame_num]] = to_rgba("#b2bec3")  # Gris clair pour exploré
+            node_border_colors[visited_ilocs[frame_num]] = to_rgba("#636e72")
+            current = step['current']
+            node_colors[current] = to_rgba("#ff5e5b")  # Nœud actuel : rouge vif
+            node_border_colors[current] = to_rgba("#c81d25")
+            node_colors[self._special_ilocs] = self._node_colors[self._special_ilocs]
+            node_border_colors[self._special_ilocs] = self._node_border_colors[self._special_ilocs]
             
-            # Dessiner le chemin trouvé jusqu'à présent
-            path_so_far = step['path_so_far']
-            if len(path_so_far) > 1:
-                path_edges = [(path_so_far[i], path_so_far[i+1]) for i in range(len(path_so_far)-1)]
-                nx.draw_networkx_edges(graph_nx, self.pos, edgelist=path_edges, edge_color="#a259f7", width=5, style="solid", ax=ax)
-                nx.draw_networkx_nodes(graph_nx, self.pos, nodelist=path_so_far[1:-1], node_color="#a259f7", node_size=1100, edgecolors="#232946", linewidths=4, ax=ax)
+            anim['nodes'].set_facecolors(node_colors)
+            anim['nodes'].set_edgecolors(node_border_colors)
             
-            # Ajouter des informations sur l'état actuel
-            info_text = f"Étape {frame_num+1}/{len(steps)}\n"
-            info_text += f"Nœud actuel: {step['current']}\n"
-            info_text += f"Nœuds visités: {', '.join(step['visited'])}\n"
+            # Chemin trouvé jusqu'à présent
+            anim['path_lc'].set_segments(path_segments_by_frame[frame_num])
+            anim['path_nodes'].set_offsets(path_offsets_by_frame[frame_num])
             
-            # Ajouter un titre
-            if step['current'] == self.graph.goal_node:
-                ax.set_title("Objectif atteint!", fontsize=18, color="#f9a826", fontweight="bold")
+            # Ajouter des informations sur l'état actuel, précédées du statut
+            # (dans les axes, pour être redessiné avec les autres artistes)
+            if current == goal:
+                info_text = "Objectif atteint!\n"
             else:
-                ax.set_title(f"Exploration du nœud {step['current']}", fontsize=18, color="#f9a826", fontweight="bold")
+                info_text = f"Exploration du nœud {self.graph.id_of(current)}\n"
+            info_text += f"Étape {step_numbers[frame_num]+1}/{total_steps}\n"
+            info_text += f"Nœud actuel: {self.graph.id_of(current)}\n"
+            info_text += f"Nœuds visités: {visited_strs[frame_num]}\n"
+            anim['info'].set_text(info_text)
+            anim['info'].set_visible(True)
             
-            ax.text(0.02, 0.02, info_text, transform=ax.transAxes, fontsize=12, color="#eebbc3",
-                   bbox=dict(facecolor='#232946', edgecolor='#f9a826', boxstyle='round,pad=0.5', alpha=0.8))
-            
-            ax.axis('off')
-            fig.patch.set_facecolor("#ffffff")  # Fond blanc figure
-            ax.set_facecolor("#ffffff")         # Fond blanc axes
-            return []
+            return anim['artists']
         
         # Créer l'animation
         ani = animation.FuncAnimation(fig, update, frames=len(steps), init_func=init, blit=True, interval=interval)